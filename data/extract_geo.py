@@ -20,20 +20,48 @@ The zipped tiles are stored in Git LFS under ned/ and nlcd/ folders.
 import os
 import zipfile
 
+# Size of the reusable copy buffer used when inflating zip members.
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Extensions of the zip members worth extracting. str.endswith with a
+# tuple short-circuits in C on the first match.
+_WANTED_EXT = ('.int', '.flt', '.hdr', '.prj')
+
+
+def _ExtractMember(zf, member, dest_dir, buf):
+  """Extracts one zip `member` to `dest_dir` using the reusable buffer `buf`."""
+  out_path = os.path.join(dest_dir, member.filename)
+  # Skip members already extracted, making re-runs near-free.
+  try:
+    if os.path.getsize(out_path) == member.file_size:
+      return
+  except OSError:
+    pass
+  out_dir = os.path.dirname(out_path)
+  if out_dir:
+    os.makedirs(out_dir, exist_ok=True)
+  with zf.open(member) as src, open(out_path, 'wb') as dst:
+    while True:
+      num_read = src.readinto(buf)
+      if not num_read:
+        break
+      dst.write(memoryview(buf)[:num_read])
+
+
 # Extract the wanted zipped data files from the given zipfile into the
 # given temporary directory.
 def UnzipNeededFiles(zip_filename, dest_dir):
   """Unzip all needed geo files from zip.
   """
-  zf = zipfile.ZipFile(zip_filename, 'r')
-  for datfile in zf.infolist():
-    if (datfile.filename.endswith('.int') or datfile.filename.endswith('.flt') or
-        datfile.filename.endswith('.hdr') or datfile.filename.endswith('.prj')):
-      try:
-        zf.extract(datfile, dest_dir)
-      except:
-        raise Exception('Cannot extract ' + datfile.filename +
-                        ' from ' + zip_filename)
+  buf = bytearray(_COPY_BUFFER_SIZE)
+  with zipfile.ZipFile(zip_filename, 'r') as zf:
+    for datfile in zf.infolist():
+      if datfile.filename.endswith(_WANTED_EXT):
+        try:
+          _ExtractMember(zf, datfile, dest_dir, buf)
+        except:
+          raise Exception('Cannot extract ' + datfile.filename +
+                          ' from ' + zip_filename)
 
 def ExtractData(directory):
   for f in os.listdir(directory):
@@ -17,6 +17,8 @@
 # other relevant data. The script writes the files into the data/fcc directory.
 
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from six.moves import urllib
 
@@ -33,15 +35,18 @@ def RetrieveURL(url):
     raise Exception('Could not find %s file' % filename)
 
   with open(filename, 'wb') as out:
-    while True:
-      c = raw.read(64*1024)
-      if not c:
-        break
-      out.write(c)
+    shutil.copyfileobj(raw, out, length=1<<20)
   raw.close()
   print('Retrieved file %s from %s' % (filename, parsed.netloc))
 
 
+def RetrieveURLs(urls):
+  """Retrieves several unrelated URLs concurrently."""
+  with ThreadPoolExecutor(max_workers=4) as executor:
+    # Materialize the results so any download error is re-raised here.
+    list(executor.map(RetrieveURL, urls))
+
+
 # Find the directory of this script.
 cur_dir = os.path.dirname(os.path.realpath(__file__))
 root_dir = os.path.dirname(cur_dir)
@@ -53,13 +58,14 @@ if not os.path.exists(dest_dir):
 os.chdir(dest_dir)
 
 
-# Retrieve needed files
+# Retrieve needed files (downloaded concurrently).
 
 # The following US/Canada forder file cannot be found anymore in this site.
-# RetrieveURL('https://transition.fcc.gov/oet/info/maps/uscabdry/uscabdry.zip')
-
-# The Mexican border file
-RetrieveURL('http://www.ibwc.gov/GIS_Maps/downloads/us_mex_boundary.zip')
+# 'https://transition.fcc.gov/oet/info/maps/uscabdry/uscabdry.zip'
 
-# The NOAA maritime boundaries
-RetrieveURL('http://maritimeboundaries.noaa.gov/downloads/USMaritimeLimitsAndBoundariesKML.kmz')
+RetrieveURLs([
+    # The Mexican border file
+    'http://www.ibwc.gov/GIS_Maps/downloads/us_mex_boundary.zip',
+    # The NOAA maritime boundaries
+    'http://maritimeboundaries.noaa.gov/downloads/USMaritimeLimitsAndBoundariesKML.kmz',
+])
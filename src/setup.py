@@ -17,12 +17,12 @@ setup(name='winnf',
           '': ['LICENSE', '*.md'],
           'winnf': [
               'propag/itm/itm_it*.%s' % ext,
-              'propag/ehata/ehata_it*.%s' % ext
+              'propag/ehata/ehata_it*.%s' % ext,
+              'geo/_kml_parse*.%s' % ext
           ],
       },
       install_requires=[
           'numpy',
-          'pykml',
           'shapely',
           'six',
       ],
@@ -1,11 +1,11 @@
 import os
+from types import SimpleNamespace
 
-# Management of geo database location
-_ZONES_DIR = None
-_NED_DIR = None
-_NLCD_DIR = None
-_COUNTY_DIR = None
-_POP_DIR = None
+# Management of geo database location.
+# `dirs` is a plain namespace supporting direct attribute access
+# (eg `winnf.dirs.ned`) which hot loops should prefer over the Get*
+# routines: an attribute read is much cheaper than a function call.
+dirs = SimpleNamespace(zones=None, ned=None, nlcd=None, county=None, pop=None)
 
 
 def SetGeoBaseDir(directory):
@@ -16,37 +16,32 @@ def SetGeoBaseDir(directory):
   SetPopDir(os.path.join(directory, 'pop'))
 
 def SetZonesDir(directory):
-  global _ZONES_DIR
-  _ZONES_DIR = directory
+  dirs.zones = directory
 
 def SetNedDir(directory):
-  global _NED_DIR
-  _NED_DIR = directory
+  dirs.ned = directory
 
 def SetNlcdDir(directory):
-  global _NLCD_DIR
-  _NLCD_DIR = directory
+  dirs.nlcd = directory
 
 def SetCountyDir(directory):
-  global _COUNTY_DIR
-  _COUNTY_DIR = directory
+  dirs.county = directory
 
 def SetPopDir(directory):
-  global _POP_DIR
-  _POP_DIR = directory
+  dirs.pop = directory
 
 
 def GetZonesDir():
-  return _ZONES_DIR
+  return dirs.zones
 
 def GetNedDir():
-  return _NED_DIR
+  return dirs.ned
 
 def GetNlcdDir():
-  return _NLCD_DIR
+  return dirs.nlcd
 
 def GetCountyDir():
-  return _COUNTY_DIR
+  return dirs.county
 
 def GetPopDir():
-  return _POP_DIR
+  return dirs.pop
@@ -0,0 +1,67 @@
+#    Copyright 2022 SAS Project Authors. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Numba compiled kernels for spherical area computation.
+
+This module is optional: when numba is not installed the kernels are set to
+None and `winnf.geo.utils` falls back to its numpy implementation.
+"""
+
+import math
+
+try:
+  from numba import njit, prange
+except ImportError:
+  njit = None
+
+if njit is not None:
+  @njit(cache=True, parallel=True, fastmath=True)
+  def _spherical_area_rings(coords, starts, signs):  # pragma: no cover
+    """Batched version of the `utils._RingArea` kernel.
+
+    Computes the total spherical area of many rings in a single call,
+    parallelized over rings, without any per-ring Python dispatch or
+    temporary array.
+
+    Args:
+      coords: A (N, 2) float64 array of all ring vertices as (lon, lat)
+        in degrees, rings laid out back to back.
+      starts: A (R+1,) int64 array: ring `r` occupies rows
+        starts[r]:starts[r+1] of `coords`.
+      signs: A (R,) float64 array: +1 for exterior rings, -1 for holes.
+
+    Returns:
+      The total area in steradians (to be scaled by the earth radii).
+    """
+    total = 0.
+    for r in prange(starts.shape[0] - 1):
+      begin = starts[r]
+      end = starts[r + 1]
+      num_coords = end - begin
+      if (coords[end - 1, 0] == coords[begin, 0] and
+          coords[end - 1, 1] == coords[begin, 1]):
+        num_coords -= 1
+      if num_coords < 3:
+        continue
+      area = 0.
+      for i in range(num_coords):
+        nxt = i + 1 if i + 1 < num_coords else 0
+        prv = i - 1 if i > 0 else num_coords - 1
+        area += math.sin(math.radians(coords[begin + i, 1])) * (
+            math.radians(coords[begin + nxt, 0]) -
+            math.radians(coords[begin + prv, 0]))
+      total += signs[r] * abs(area)
+    return total
+else:
+  _spherical_area_rings = None
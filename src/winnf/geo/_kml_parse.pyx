@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+#    Copyright 2022 SAS Project Authors. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""C parser for KML <coordinates> text blocks.
+
+Build in place with: python setup.py build_ext -i
+This extension is optional: `winnf.geo.zones` falls back to its numpy
+parser when the compiled module is absent.
+"""
+
+from libc.stdlib cimport strtod
+
+import numpy as np
+
+
+def ParseCoordString(text):
+  """Parses a KML <coordinates> text block into a (N, 2) lon/lat array.
+
+  The text holds whitespace separated `lon,lat[,alt]` tuples. A single
+  strtod scan over the raw bytes extracts all values, without the
+  whitespace-normalized copy of the text the numpy parser requires.
+
+  Args:
+    text: The <coordinates> element text (str or bytes).
+
+  Returns:
+    A (N, 2) float64 ndarray of the (longitude, latitude) vertices.
+  """
+  data = text.encode('ascii') if isinstance(text, str) else text
+  cdef const char* p = data
+  cdef const char* end = p + len(data)
+  cdef char* q
+  cdef double lon, lat
+  cdef Py_ssize_t count = 0
+  # Each tuple takes at least 4 bytes ('0,0 '), so this never overflows.
+  buf_arr = np.empty((len(data) // 4 + 1, 2), dtype=np.float64)
+  cdef double[:, ::1] buf = buf_arr
+  while p < end:
+    while p < end and (p[0] == b' ' or p[0] == b'\n' or
+                       p[0] == b'\t' or p[0] == b'\r'):
+      p += 1
+    if p >= end:
+      break
+    lon = strtod(p, &q)
+    if q == p:
+      break
+    p = q
+    if p < end and p[0] == b',':
+      p += 1
+    lat = strtod(p, &q)
+    p = q
+    if p < end and p[0] == b',':
+      # Discard the optional altitude field.
+      p += 1
+      strtod(p, &q)
+      p = q
+    buf[count, 0] = lon
+    buf[count, 1] = lat
+    count += 1
+  return buf_arr[:count].copy()
@@ -0,0 +1,27 @@
+# Copyright 2022 SAS Project Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# To install the module, run 'python setup.py build_ext -i' to install
+# into the local directory. Run 'python setup.py build' to build the
+# module. See distutils documentation for more info.
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+kml_parse_module = Extension('_kml_parse', sources=['_kml_parse.pyx'])
+
+setup(name='_kml_parse',
+      version='1.0',
+      description='C parser for KML coordinates blocks',
+      ext_modules=cythonize([kml_parse_module]))
@@ -18,13 +18,32 @@
 """Utility geometry routines.
 """
 import json
+import math
 
 import numpy as np
+import shapely
 import shapely.geometry as sgeo
 import shapely.ops as ops
 from shapely import affinity
+from shapely.prepared import prep
 
-import six
+try:
+  from numba import njit
+except ImportError:
+  njit = None
+
+from winnf.geo._area_nb import _spherical_area_rings
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+# Parsing goes through orjson when available. Serialization stays on the
+# stdlib: callers rely on its canonical `", "`-separated formatting, which
+# orjson does not reproduce.
+_loads = orjson.loads if orjson is not None else json.loads
+_dumps = json.dumps
 
 
 # Earth ellipsoidal parameters.
@@ -34,6 +53,41 @@ _WGS_POLAR_RADIUS_KM2 = 6356.753
 _EQUATORIAL_DIST_PER_DEGREE = 2 * np.pi * _WGS_EQUATORIAL_RADIUS_KM2 / 360
 _POLAR_DIST_PER_DEGREE = 2 * np.pi * _WGS_POLAR_RADIUS_KM2 / 360
 
+# Shapely 2.x provides vectorized constructors implemented in C.
+_HAS_SHAPELY2 = hasattr(shapely, 'multipoints')
+
+
+def _GeomsOf(geometry):
+  """Returns the parts of a geometry (single geometries yield themselves)."""
+  try:
+    return geometry.geoms
+  except AttributeError:
+    return [geometry]
+
+
+def _RingIsCcw(ring):
+  """Returns True if the ring (sequence of (lon, lat)) winds counterclockwise.
+
+  Orientation is read off a single cross product at the lexicographically
+  smallest vertex, which necessarily lies on the convex hull; the full
+  shoelace sum is only evaluated in the degenerate case where that cross
+  product vanishes (duplicate vertex or collinear neighbors). Works with
+  both closed and unclosed rings.
+  """
+  a = np.asarray(ring, dtype=float)
+  if a[0, 0] == a[-1, 0] and a[0, 1] == a[-1, 1]:
+    a = a[:-1]
+  x, y = a[:, 0], a[:, 1]
+  # Index of the minimum (lon, lat) vertex, found in O(N) without sorting.
+  candidates = np.flatnonzero(x == x.min())
+  i = candidates[np.argmin(y[candidates])]
+  prev_pt, pt, next_pt = a[i - 1], a[i], a[(i + 1) % a.shape[0]]
+  det = ((pt[0] - prev_pt[0]) * (next_pt[1] - prev_pt[1])
+         - (next_pt[0] - prev_pt[0]) * (pt[1] - prev_pt[1]))
+  if det:
+    return det > 0
+  return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) > 0
+
 
 def HasCorrectGeoJsonWinding(geometry):
   """Returns True if a GeoJSON geometry has correct windings.
@@ -47,17 +101,17 @@ def HasCorrectGeoJsonWinding(geometry):
   Raises:
     ValueError: If invalid input or GeoJSON geometry type.
   """
-  if isinstance(geometry, six.string_types):
-    geometry = json.loads(geometry)
+  if isinstance(geometry, str):
+    geometry = _loads(geometry)
   if not isinstance(geometry, dict) or 'type' not in geometry:
     raise ValueError('Invalid GeoJSON geometry.')
 
   def _HasSinglePolygonCorrectWinding(coords):
     exterior = coords[0]
-    if not sgeo.LinearRing(exterior).is_ccw:
+    if not _RingIsCcw(exterior):
       return False
     for hole in coords[1:]:
-      if sgeo.LinearRing(hole).is_ccw:
+      if _RingIsCcw(hole):
         return False
     return True
 
@@ -96,8 +150,8 @@ def InsureGeoJsonWinding(geometry):
     return geometry
 
   is_str = False
-  if isinstance(geometry, six.string_types):
-    geometry = json.loads(geometry)
+  if isinstance(geometry, str):
+    geometry = _loads(geometry)
     is_str = True
   if not isinstance(geometry, dict) or 'type' not in geometry:
     raise ValueError('Invalid GeoJSON geometry.')
@@ -105,22 +159,25 @@ def InsureGeoJsonWinding(geometry):
   def _InsureSinglePolygonCorrectWinding(coords):
     """Modifies in place the coords for correct windings."""
     exterior = coords[0]
-    if not sgeo.LinearRing(exterior).is_ccw:
+    if not _RingIsCcw(exterior):
       exterior.reverse()
     for hole in coords[1:]:
-      if sgeo.LinearRing(hole).is_ccw:
+      if _RingIsCcw(hole):
         hole.reverse()
 
-  def _list_convert(x):
-    # shapely mapping returns a nested tuple.
-    return [_list_convert(xx) for xx in x] if isinstance(x, (tuple, list)) else x
-
-  if 'coordinates' in geometry:
-    geometry['coordinates'] = _list_convert(geometry['coordinates'])
+  def _RingsToLists(coords, depth):
+    # shapely mapping returns a nested tuple: convert to lists only down to
+    # ring level, which is where reverse() operates. The (x, y) vertex
+    # entries are left untouched since reversal just permutes the ring list.
+    if depth == 1:
+      return list(coords)
+    return [_RingsToLists(c, depth - 1) for c in coords]
 
   if geometry['type'] == 'Polygon':
+    geometry['coordinates'] = _RingsToLists(geometry['coordinates'], 2)
     _InsureSinglePolygonCorrectWinding(geometry['coordinates'])
   elif geometry['type'] == 'MultiPolygon':
+    geometry['coordinates'] = _RingsToLists(geometry['coordinates'], 3)
     for coords in geometry['coordinates']:
       _InsureSinglePolygonCorrectWinding(coords)
   elif geometry['type'] == 'GeometryCollection':
@@ -128,7 +185,7 @@ def InsureGeoJsonWinding(geometry):
       InsureGeoJsonWinding(subgeo)
 
   if is_str:
-    geometry = json.dumps(geometry)
+    geometry = _dumps(geometry)
   return geometry
 
 
@@ -141,8 +198,8 @@ def _GeoJsonToShapelyGeometry(geometry):
   Raises:
     ValueError: If invalid GeoJSON geometry is passed.
   """
-  if isinstance(geometry, six.string_types):
-    geometry = json.loads(geometry)
+  if isinstance(geometry, str):
+    geometry = _loads(geometry)
   if not isinstance(geometry, dict) or 'type' not in geometry:
     raise ValueError('Invalid GeoJSON geometry.')
 
@@ -150,8 +207,12 @@ def _GeoJsonToShapelyGeometry(geometry):
     return sgeo.GeometryCollection([_GeoJsonToShapelyGeometry(g)
                                     for g in geometry['geometries']])
   geometry = sgeo.shape(geometry)
-  if isinstance(geometry, sgeo.Polygon) or isinstance(geometry, sgeo.MultiPolygon):
-    geometry = geometry.buffer(0)
+  if (isinstance(geometry, (sgeo.Polygon, sgeo.MultiPolygon))
+      and not geometry.is_valid):
+    # Only repair invalid polygons: the validity check is much cheaper than
+    # the buffer(0) overlay that well-formed GeoJSON was paying before.
+    geometry = (shapely.make_valid(geometry)
+                if hasattr(shapely, 'make_valid') else geometry.buffer(0))
   return geometry
 
 
@@ -175,6 +236,28 @@ def ToShapely(geometry):
     return _GeoJsonToShapelyGeometry(geometry)
 
 
+def _CoordsToLists(coords):
+  """Recursively converts nested coordinate tuples to lists."""
+  if not isinstance(coords, (list, tuple)):
+    return coords
+  return [_CoordsToLists(c) for c in coords]
+
+
+def _JsonNativeGeometry(json_geometry):
+  """Returns the GeoJSON dict with all coordinate tuples turned into lists.
+
+  This matches the output of a dumps/loads round-trip, which callers of
+  the dict form rely on (eg to mutate rings in place).
+  """
+  json_geometry = dict(json_geometry)
+  if 'geometries' in json_geometry:
+    json_geometry['geometries'] = [_JsonNativeGeometry(subgeo)
+                                   for subgeo in json_geometry['geometries']]
+  if 'coordinates' in json_geometry:
+    json_geometry['coordinates'] = _CoordsToLists(json_geometry['coordinates'])
+  return json_geometry
+
+
 def ToGeoJson(geometry, as_dict=False):
   """Returns a GeoJSON geometry from a generic geometry.
 
@@ -185,8 +268,17 @@ def ToGeoJson(geometry, as_dict=False):
     geometry: A generic geometry, for example a shapely geometry.
     as_dict: If True returns the GeoJSON as a dict, otherwise as a string.
   """
-  json_geometry = json.dumps(InsureGeoJsonWinding(geometry.__geo_interface__))
-  return json.loads(json_geometry) if as_dict else json_geometry
+  if (hasattr(shapely, 'orient_polygons')
+      and isinstance(geometry, sgeo.base.BaseGeometry)):
+    # One vectorized C call normalizes every ring to the RFC 7946 winding
+    # (exterior CCW, holes CW), replacing the per-ring Python pass.
+    json_geometry = sgeo.mapping(shapely.orient_polygons(geometry))
+  else:
+    json_geometry = InsureGeoJsonWinding(geometry.__geo_interface__)
+  # The dict form keeps the contract of the former dumps/loads round-trip:
+  # JSON-native lists all the way down, not shapely's nested tuples.
+  return (_JsonNativeGeometry(json_geometry) if as_dict
+          else _dumps(json_geometry))
 
 
 def InsureFeatureCollection(geometry, as_dict=False):
@@ -196,8 +288,8 @@ def InsureFeatureCollection(geometry, as_dict=False):
     geometry: A geojson geometry, either as dict or str. Can be any type
       of GeoJSON: standard geometry, feature or feature collection.
   """
-  if isinstance(geometry, six.string_types):
-    geometry = json.loads(geometry)
+  if isinstance(geometry, str):
+    geometry = _loads(geometry)
   if 'type' not in geometry:
     raise ValueError('Invalid GeoJSON geometry.')
   if geometry['type'] == 'FeatureCollection':
@@ -213,7 +305,7 @@ def InsureFeatureCollection(geometry, as_dict=False):
                     'geometry': geometry}
                 ]
     }
-  return geometry if as_dict else json.dumps(geometry)
+  return geometry if as_dict else _dumps(geometry)
 
 
 def PolygonsAlmostEqual(poly_ref, poly, tol_perc=10):
@@ -229,10 +321,30 @@ def PolygonsAlmostEqual(poly_ref, poly, tol_perc=10):
   """
   poly_ref = ToShapely(poly_ref)
   poly = ToShapely(poly)
-  union_polys = poly_ref.union(poly)
-  intersection_polys = poly_ref.intersection(poly)
-  return ((GeometryArea(union_polys) - GeometryArea(intersection_polys))
-          < tol_perc/100. * GeometryArea(poly_ref))
+  # Trivial cases short-circuit before any boolean overlay.
+  if poly_ref.equals(poly):
+    return True
+  if not poly_ref.intersects(poly):
+    return False
+  # The symmetric difference area equals union area minus intersection
+  # area, in a single GEOS overlay instead of two.
+  sym_diff = poly_ref.symmetric_difference(poly)
+  return (_GeometryAreaShapely(sym_diff)
+          < tol_perc/100. * _GeometryAreaShapely(poly_ref))
+
+
+if njit is not None:
+  @njit(cache=True, fastmath=True)
+  def _ring_area_nb(latitudes, longitudes):  # pragma: no cover
+    """Single pass scalar kernel of `_RingArea` (lat/lon in radians)."""
+    num_coords = latitudes.shape[0]
+    total = 0.
+    for i in range(num_coords):
+      nxt = i + 1 if i + 1 < num_coords else 0
+      total += math.sin(latitudes[i]) * (longitudes[nxt] - longitudes[i - 1])
+    return abs(total)
+else:
+  _ring_area_nb = None
 
 
 def _RingArea(latitudes, longitudes):
@@ -258,12 +370,21 @@ def _RingArea(latitudes, longitudes):
   if num_coords < 3:
     return 0.
 
-  idx = np.arange(num_coords)
-  next = idx + 1
-  next[-1] = 0
-  prev = idx - 1
-
-  area = np.sum(np.sin(latitudes) * (longitudes[next] - longitudes[prev]))
+  if _ring_area_nb is not None:
+    # Compiled scalar loop: no temporaries at all, which beats the numpy
+    # path on the typical short rings where allocation dominates.
+    area = _ring_area_nb(np.ascontiguousarray(latitudes),
+                         np.ascontiguousarray(longitudes))
+    return area * 0.5 * _WGS_EQUATORIAL_RADIUS_KM2 * _WGS_POLAR_RADIUS_KM2
+
+  # Trapezoidal form: each edge contributes (lon2-lon1)*(sin(lat1)+sin(lat2)),
+  # which telescopes to the same cyclic sum as the centered-difference
+  # formula but works purely on slice views - one sin() evaluation per
+  # vertex and a single dot product, with no scatter buffer.
+  sin_lat = np.sin(latitudes)
+  area = np.dot(longitudes[1:] - longitudes[:-1], sin_lat[:-1] + sin_lat[1:])
+  # Closing edge back to the first vertex.
+  area += (longitudes[0] - longitudes[-1]) * (sin_lat[-1] + sin_lat[0])
   area *= 0.5 * _WGS_EQUATORIAL_RADIUS_KM2 * _WGS_POLAR_RADIUS_KM2
   return np.abs(area)
 
@@ -288,35 +409,85 @@ def GeometryArea(geometry, merge_geometries=False):
   Returns:
     The approximate area within the geometry (in square kilometers).
   """
-  geometry = ToShapely(geometry)
-  if (isinstance(geometry, sgeo.Point) or
-      isinstance(geometry, sgeo.LineString) or
-      isinstance(geometry, sgeo.LinearRing)):
-    # Lines, rings and points have null area
+  return _GeometryAreaShapely(ToShapely(geometry), merge_geometries)
+
+
+def _GeometryAreaShapely(geometry, merge_geometries=False):
+  """Same as `GeometryArea` but assumes an already |shapely| geometry input."""
+  if merge_geometries and isinstance(geometry, sgeo.base.BaseMultipartGeometry):
+    geometry = ops.unary_union(list(geometry.geoms))
+  # Iterative sweep over all polygons with an explicit stack: descending
+  # into multi geometries directly avoids re-entering the `ToShapely`
+  # dispatch and the Python recursion per sub-geometry.
+  polygons = []
+  stack = [geometry]
+  while stack:
+    geom = stack.pop()
+    if isinstance(geom, sgeo.Polygon):
+      polygons.append(geom)
+    elif isinstance(geom, sgeo.base.BaseMultipartGeometry):
+      stack.extend(geom.geoms)
+    # Points, lines and rings have null area.
+  if not polygons:
     return 0.
-  elif isinstance(geometry, sgeo.Polygon):
-    return (_RingArea(geometry.exterior.xy[1], geometry.exterior.xy[0])
-            - sum(_RingArea(interior.xy[1], interior.xy[0])
-                  for interior in geometry.interiors))
-  else:
-    # Multi geometries
-    if merge_geometries:
-      geometry = ops.unary_union(geometry)
-      # Test if dissolved into a simple geometry.
-      try:
-        iter(geometry)
-      except TypeError:
-        return GeometryArea(geometry)
-    return sum(GeometryArea(simple_shape) for simple_shape in geometry)
-
-
-def _ProjectEqc(geometry, ref_latitude=None):
+  if _spherical_area_rings is not None and _HAS_SHAPELY2:
+    # Batched compiled path: all rings are flattened into one coordinate
+    # array through shapely's C accessors and summed by a single
+    # parallelized kernel call, with no per-ring Python dispatch.
+    polygons = np.asarray(polygons, dtype=object)
+    rings = shapely.get_rings(polygons)
+    coords = shapely.get_coordinates(rings)
+    starts = np.empty(len(rings) + 1, dtype=np.int64)
+    starts[0] = 0
+    np.cumsum(shapely.get_num_coordinates(rings), out=starts[1:])
+    # get_rings lays out each polygon as exterior ring then holes.
+    signs = -np.ones(len(rings))
+    num_interiors = shapely.get_num_interior_rings(polygons)
+    signs[np.concatenate(([0], np.cumsum(num_interiors[:-1] + 1)))] = 1.
+    area = _spherical_area_rings(coords, starts, signs)
+    return area * 0.5 * _WGS_EQUATORIAL_RADIUS_KM2 * _WGS_POLAR_RADIUS_KM2
+  area = 0.
+  for geom in polygons:
+    # A single asarray() of the coordinate sequence: the `.xy` property
+    # would split the ring into two fresh arrays on every access.
+    c = np.asarray(geom.exterior.coords)
+    area += _RingArea(c[:, 1], c[:, 0])
+    for interior in geom.interiors:
+      c = np.asarray(interior.coords)
+      area -= _RingArea(c[:, 1], c[:, 0])
+  return area
+
+
+def _ScaleCoords(geometry, sx, sy):
+  """Scales the coordinates of a geometry by (`sx`, `sy`).
+
+  On Shapely 2 this operates on the raw coordinate array in a single
+  vectorized multiply instead of walking the geometry tree per vertex
+  as `affinity.affine_transform` does.
+  """
+  if _HAS_SHAPELY2:
+    return shapely.transform(geometry, lambda coords: coords * (sx, sy))
+  return affinity.affine_transform(geometry, (sx, 0.0, 0.0, sy, 0, 0))
+
+
+def _ProjectEqcScales(ref_latitude):
+  """Returns the (sx, sy) Eqc projection scales at a reference latitude.
+
+  Callers transforming many geometries at the same latitude can precompute
+  these once and pass them to `_ProjectEqc`/`_InvProjectEqc`.
+  """
+  return (_EQUATORIAL_DIST_PER_DEGREE * np.cos(np.radians(ref_latitude)),
+          _POLAR_DIST_PER_DEGREE)
+
+
+def _ProjectEqc(geometry, ref_latitude=None, scales=None):
   """Projects a geometry using equirectangular projection.
 
   Args:
     geometry: A |shapely| geometry with lon,lat coordinates.
     ref_latitude: A reference latitude for the Eqc projection. If None, using
       the centroid of the geometry.
+    scales: Optional precomputed `_ProjectEqcScales(ref_latitude)`.
   Returns:
     A tuple of:
       the same geometry in equirectangular projection.
@@ -324,27 +495,23 @@ def _ProjectEqc(geometry, ref_latitude=None):
   """
   if ref_latitude is None:
     ref_latitude = geometry.centroid.y
-  geometry = affinity.affine_transform(
-      geometry,
-      (_EQUATORIAL_DIST_PER_DEGREE * np.cos(np.radians(ref_latitude)), 0.0,
-       0.0, _POLAR_DIST_PER_DEGREE,
-       0, 0))
+  if scales is None:
+    scales = _ProjectEqcScales(ref_latitude)
+  geometry = _ScaleCoords(geometry, scales[0], scales[1])
   return geometry, ref_latitude
 
 
-def _InvProjectEqc(geometry, ref_latitude):
+def _InvProjectEqc(geometry, ref_latitude, scales=None):
   """Returns the inverse equirectangular projection of a geometry.
 
   Args:
     geometry: A |shapely| geometry with lon,lat coordinates.
     ref_latitude: The reference latitude of the equirectangular projection.
+    scales: Optional precomputed `_ProjectEqcScales(ref_latitude)`.
   """
-  geometry = affinity.affine_transform(
-      geometry,
-      (1./(_EQUATORIAL_DIST_PER_DEGREE * np.cos(np.radians(ref_latitude))), 0.0,
-       0.0, 1./_POLAR_DIST_PER_DEGREE,
-       0, 0))
-  return geometry
+  if scales is None:
+    scales = _ProjectEqcScales(ref_latitude)
+  return _ScaleCoords(geometry, 1. / scales[0], 1. / scales[1])
 
 
 def Buffer(geometry, distance_km, ref_latitude=None, **kwargs):
@@ -363,16 +530,106 @@ def Buffer(geometry, distance_km, ref_latitude=None, **kwargs):
       (for example: resolution, cap_style, join_style)
   """
   geom = ToShapely(geometry)
-  proj_geom, ref_latitude = _ProjectEqc(geom, ref_latitude)
+  if ref_latitude is None:
+    ref_latitude = geom.centroid.y
+  # Compute the projection scales once and reuse them for the inverse so the
+  # round-trip involves a single trig evaluation and scales exactly.
+  scales = _ProjectEqcScales(ref_latitude)
+  proj_geom, ref_latitude = _ProjectEqc(geom, ref_latitude, scales=scales)
   proj_geom = proj_geom.buffer(distance_km, **kwargs)
-  geom = _InvProjectEqc(proj_geom, ref_latitude)
+  geom = _InvProjectEqc(proj_geom, ref_latitude, scales=scales)
   if isinstance(geometry, sgeo.base.BaseGeometry):
     return geom
   else:
     return ToGeoJson(geom, as_dict=isinstance(geometry, dict))
 
 
-def GridPolygon(poly, res_arcsec):
+def _FilterGridPoints(poly, points):
+  """Returns the grid `points` (an (N,2) array) falling inside `poly`.
+
+  Points on the polygon boundary are included: the polygon is dilated by
+  1e-8 deg (about 1mm) so grid points landing exactly on an edge still
+  test inside. The result stays an (M,2) ndarray: tuples are only
+  materialized at the public API boundary.
+  """
+  if (poly.geom_type == 'Polygon' and not poly.interiors and
+      len(poly.exterior.coords) == 5):
+    # Axis-aligned rectangle (common for exclusion zones and protection
+    # areas): filtering reduces to coordinate-bound trimming, with the
+    # same 1e-8 boundary tolerance as the generic path below.
+    minx, miny, maxx, maxy = poly.bounds
+    if poly.area == (maxx - minx) * (maxy - miny):
+      mask = ((points[:, 0] >= minx - 1e-8) & (points[:, 0] <= maxx + 1e-8) &
+              (points[:, 1] >= miny - 1e-8) & (points[:, 1] <= maxy + 1e-8))
+      return points[mask]
+  poly = poly.buffer(1e-8)
+  if _HAS_SHAPELY2:
+    # Vectorized point-in-polygon predicate: the polygon is prepared once
+    # and all coordinates are tested in a single C call, avoiding the
+    # construction and intersection of a large MultiPoint.
+    shapely.prepare(poly)
+    mask = shapely.contains_xy(poly, points[:, 0], points[:, 1])
+    return points[mask]
+  # Shapely 1 fallback: a prepared geometry indexes the polygon edges once,
+  # making each point test O(log E) instead of one monolithic MultiPoint
+  # intersection.
+  prepared_poly = prep(poly)
+  mask = np.fromiter((prepared_poly.contains(sgeo.Point(x, y))
+                      for x, y in points), dtype=bool, count=len(points))
+  return points[mask]
+
+
+def _GridMultiGeometry(poly, lngs, lats):
+  """Grids a sparse multipart geometry using an STRtree over its components.
+
+  The lattice is swept in blocks of rows: each block bounding box is queried
+  against the tree, so blocks falling between components are rejected without
+  materializing any grid point, and blocks hitting components only test
+  containment against the few candidate components returned by the query.
+
+  Args:
+    poly: A |shapely.MultiPolygon| or |shapely.GeometryCollection|.
+    lngs: 1D array of the lattice longitudes.
+    lats: 1D array of the lattice latitudes.
+
+  Returns:
+    A lexically sorted (N,2) array of (lon, lat) defining the grid points.
+  """
+  components = list(poly.geoms)
+  tree = shapely.STRtree(components)
+  # Dilated (by the usual 1e-8 boundary tolerance) and prepared components,
+  # built lazily: blocks only pay for the components they actually hit.
+  dilated = [None] * len(components)
+  chunks = []
+  block = 256
+  for start in range(0, lats.size, block):
+    block_lats = lats[start:start + block]
+    box = sgeo.box(lngs[0], block_lats[0], lngs[-1], block_lats[-1])
+    idxs = tree.query(box, predicate='intersects')
+    if not idxs.size:
+      continue
+    points = np.empty((lngs.size * block_lats.size, 2))
+    points[:, 0] = np.repeat(lngs, block_lats.size)
+    points[:, 1] = np.tile(block_lats, lngs.size)
+    mask = np.zeros(len(points), np.bool_)
+    for idx in idxs:
+      geom = dilated[idx]
+      if geom is None:
+        geom = components[idx].buffer(1e-8)
+        shapely.prepare(geom)
+        dilated[idx] = geom
+      mask |= shapely.contains_xy(geom, points[:, 0], points[:, 1])
+    chunks.append(points[mask])
+  if not chunks:
+    return np.empty((0, 2))
+  # The blocks partition the lattice rows and the per-block masks are
+  # OR-merged, so the chunks hold no duplicate: only the documented
+  # (lon, lat) lexical order remains to restore.
+  pts = np.vstack(chunks)
+  return pts[np.lexsort((pts[:, 1], pts[:, 0]))]
+
+
+def GridPolygon(poly, res_arcsec, as_array=False):
   """Grids a polygon or multi-polygon.
 
   This performs regular gridding of a polygon in PlateCarree (equirectangular)
@@ -384,50 +641,63 @@ def GridPolygon(poly, res_arcsec):
       shapely, GeoJSON (dict or str) or generic  geometry.
       A generic geometry is any object implementing the __geo_interface__ protocol.
     res_arcsec: The resolution (in arcsec) used for regular gridding.
+    as_array: If True, returns an (N,2) ndarray instead of a list of tuples.
+      The gridding is array-based internally, so this skips the one Python
+      tuple per point otherwise built at the boundary - preferable for
+      vectorized consumers.
 
   Returns:
-    A list of (lon, lat) defining the grid points.
+    A list of (lon, lat) defining the grid points, or an (N,2) ndarray if
+    `as_array` is set.
   """
   poly = ToShapely(poly)
-  bound_area = (poly.bounds[2] - poly.bounds[0]) * (poly.bounds[3] - poly.bounds[1])
-  if not poly:
-    return []
-  if isinstance(poly, sgeo.MultiPolygon) and poly.area < bound_area * 0.01:
-    # For largely disjoint polygons, we process per polygon
-    # to avoid inefficiencies if polygons largely disjoint.
-    pts = ops.unary_union(
-        [sgeo.asMultiPoint(GridPolygon(p, res_arcsec))
-         for p in poly])
-    return [(p.x, p.y) for p in pts]
-
+  # O(1) emptiness flag, checked before any bounds computation. Geometry
+  # truthiness is deprecated in Shapely 2.
+  if poly.is_empty:
+    return np.empty((0, 2)) if as_array else []
+  # Unpack the bounds once: each .bounds access is a GEOS call.
+  min_lng, min_lat, max_lng, max_lat = poly.bounds
+  bound_area = (max_lng - min_lng) * (max_lat - min_lat)
   res = res_arcsec / 3600.
-  bounds = poly.bounds
-  lng_min = np.floor(bounds[0] / res) * res
-  lat_min = np.floor(bounds[1] / res) * res
-  lng_max = np.ceil(bounds[2] / res) * res + res/2
-  lat_max = np.ceil(bounds[3] / res) * res + res/2
+  lng_min = np.floor(min_lng / res) * res
+  lat_min = np.floor(min_lat / res) * res
+  lng_max = np.ceil(max_lng / res) * res + res/2
+  lat_max = np.ceil(max_lat / res) * res + res/2
   # The mesh creation is conceptually equivalent to
   #mesh_lng, mesh_lat = np.mgrid[lng_min:lng_max:res,
   #                              lat_min:lat_max:res]
-  # but without the floating point accumulation errors
-  mesh_lng, mesh_lat = np.meshgrid(
-      np.arange(np.floor((lng_max - lng_min) / res) + 1),
-      np.arange(np.floor((lat_max - lat_min) / res) + 1),
-      indexing='ij')
-  mesh_lng = lng_min + mesh_lng * res
-  mesh_lat = lat_min + mesh_lat * res
-  points = np.vstack((mesh_lng.ravel(), mesh_lat.ravel())).T
-  # Performs slight buffering by 1mm to include border points in case they fall
-  # exactly on a multiple of 1 arcsec.
-  pts = poly.buffer(1e-8).intersection(sgeo.asMultiPoint(points))
-  if not pts:
-    return []
-  if isinstance(pts, sgeo.Point):
-    return [(pts.x, pts.y)]
-  return [(p.x, p.y) for p in pts]
-
-
-def GridPolygonMetric(poly, res_km):
+  # but without the floating point accumulation errors, and built from the
+  # 1D axes by repeat/tile directly into the output array rather than
+  # materializing full 2D meshgrid temporaries.
+  lngs = lng_min + np.arange(np.floor((lng_max - lng_min) / res) + 1) * res
+  lats = lat_min + np.arange(np.floor((lat_max - lat_min) / res) + 1) * res
+  if (isinstance(poly, (sgeo.MultiPolygon, sgeo.GeometryCollection)) and
+      poly.area < bound_area * 0.01):
+    # For largely disjoint components, a single sweep over the full bounding
+    # box lattice is wasteful: most of the lattice falls between components.
+    if _HAS_SHAPELY2:
+      pts = _GridMultiGeometry(poly, lngs, lats)
+      return pts if as_array else list(map(tuple, pts.tolist()))
+    # Shapely 1 fallback: grid each component over its own (small) bounds.
+    # The per-component grids all live on the same global lattice, so a
+    # plain set union dedupes points shared by overlapping bounds without
+    # a GEOS unary_union pass.
+    pts = set()
+    for p in poly.geoms:
+      pts.update(GridPolygon(p, res_arcsec))
+    pts = sorted(pts)
+    return np.array(pts).reshape(-1, 2) if as_array else pts
+
+  points = np.empty((lngs.size * lats.size, 2))
+  points[:, 0] = np.repeat(lngs, lats.size)
+  points[:, 1] = np.tile(lats, lngs.size)
+  pts = _FilterGridPoints(poly, points)
+  # tolist() materializes plain floats in one C pass; iterating the 2D
+  # array would allocate a row subarray per point.
+  return pts if as_array else list(map(tuple, pts.tolist()))
+
+
+def GridPolygonMetric(poly, res_km, as_array=False):
   """Grids a polygon or multi-polygon with approximate resolution (in km).
 
   This is a replacement of `utils.GridPolygon()` for gridding with
@@ -442,49 +712,59 @@ def GridPolygonMetric(poly, res_km):
       A generic geometry is any object implementing the __geo_interface__
       protocol.
     res_km: The resolution (in km) used for gridding.
+    as_array: If True, returns an (N,2) ndarray instead of a list of tuples.
+      The gridding is array-based internally, so this skips the one Python
+      tuple per point otherwise built at the boundary - preferable for
+      vectorized consumers.
 
   Returns:
-    A list of (lon, lat) defining the grid points.
+    A list of (lon, lat) defining the grid points, or an (N,2) ndarray if
+    `as_array` is set.
   """
   poly = ToShapely(poly)
-  bound_area = ((poly.bounds[2] - poly.bounds[0]) *
-                (poly.bounds[3] - poly.bounds[1]))
+  # Unpack the bounds once: each .bounds access is a GEOS call.
+  min_lng, min_lat, max_lng, max_lat = poly.bounds
+  bound_area = (max_lng - min_lng) * (max_lat - min_lat)
   if isinstance(poly, sgeo.MultiPolygon) and poly.area < bound_area * 0.01:
     # For largely disjoint polygons, we process per polygon
     # to avoid inefficiencies if polygons largely disjoint.
-    pts = ops.unary_union(
-        [sgeo.asMultiPoint(GridPolygonMetric(p, res_km))
-         for p in poly])
-    return [(p.x, p.y) for p in pts]
+    # See GridPolygon: the set union replaces a GEOS unary_union of
+    # per-component MultiPoints. Note the components are gridded on
+    # different lattices (the reference latitude is per-component), so
+    # duplicates are only removed when bit-identical, as before.
+    pts = set()
+    for p in poly.geoms:
+      pts.update(GridPolygonMetric(p, res_km))
+    pts = sorted(pts)
+    return np.array(pts).reshape(-1, 2) if as_array else pts
 
   # Note: using as reference the min latitude, ie actual resolution < res_km.
   # This is to match NTIA procedure.
-  ref_latitude = poly.bounds[1]  # ref_latitude = poly.centroid.y
+  ref_latitude = min_lat  # ref_latitude = poly.centroid.y
   res_lat = res_km / _POLAR_DIST_PER_DEGREE
   res_lng = res_km / (
       _EQUATORIAL_DIST_PER_DEGREE * np.cos(np.radians(ref_latitude)))
-  bounds = poly.bounds
-  lng_min = np.floor(bounds[0] / res_lng) * res_lng
-  lat_min = np.floor(bounds[1] / res_lat) * res_lat
-  lng_max = np.ceil(bounds[2] / res_lng) * res_lng + res_lng/2.
-  lat_max = np.ceil(bounds[3] / res_lat) * res_lat + res_lat/2.
+  lng_min = np.floor(min_lng / res_lng) * res_lng
+  lat_min = np.floor(min_lat / res_lat) * res_lat
+  lng_max = np.ceil(max_lng / res_lng) * res_lng + res_lng/2.
+  lat_max = np.ceil(max_lat / res_lat) * res_lat + res_lat/2.
   # The mesh creation is conceptually equivalent to
   # mesh_lng, mesh_lat = np.mgrid[lng_min:lng_max:res_lng,
   #                               lat_min:lat_max:res_lat]
-  # but without the floating point accumulation errors
-  mesh_lng, mesh_lat = np.meshgrid(
-      np.arange(np.floor((lng_max - lng_min) / res_lng) + 1),
-      np.arange(np.floor((lat_max - lat_min) / res_lat) + 1),
-      indexing='ij')
-  mesh_lng = lng_min + mesh_lng * res_lng
-  mesh_lat = lat_min + mesh_lat * res_lat
-  points = np.vstack((mesh_lng.ravel(), mesh_lat.ravel())).T
-  # Performs slight buffering by 1mm to include border points in case they fall
-  # exactly on a multiple of
-  pts = poly.buffer(1e-8).intersection(sgeo.asMultiPoint(points))
-  if isinstance(pts, sgeo.Point):
-    return [(pts.x, pts.y)]
-  return [(p.x, p.y) for p in pts]
+  # but without the floating point accumulation errors, and built from the
+  # 1D axes by repeat/tile directly into the output array rather than
+  # materializing full 2D meshgrid temporaries.
+  lngs = lng_min + np.arange(
+      np.floor((lng_max - lng_min) / res_lng) + 1) * res_lng
+  lats = lat_min + np.arange(
+      np.floor((lat_max - lat_min) / res_lat) + 1) * res_lat
+  points = np.empty((lngs.size * lats.size, 2))
+  points[:, 0] = np.repeat(lngs, lats.size)
+  points[:, 1] = np.tile(lats, lngs.size)
+  pts = _FilterGridPoints(poly, points)
+  # tolist() materializes plain floats in one C pass; iterating the 2D
+  # array would allocate a row subarray per point.
+  return pts if as_array else list(map(tuple, pts.tolist()))
 
 
 def SampleLine(line, res_km, ref_latitude=None,
@@ -503,15 +783,25 @@ def SampleLine(line, res_km, ref_latitude=None,
     A list of (lon, lat) along the line every `res_km`.
   """
   line = ToShapely(line)
-  proj_line, ref_latitude = _ProjectEqc(line, ref_latitude)
+  if ref_latitude is None:
+    ref_latitude = line.centroid.y
+  scales = _ProjectEqcScales(ref_latitude)
+  proj_line, ref_latitude = _ProjectEqc(line, ref_latitude, scales=scales)
   if not equal_intervals:
-    points = sgeo.MultiPoint(
-        [proj_line.interpolate(dist)
-         for dist in np.arange(0, ratio * proj_line.length - 1e-6, res_km)])
+    dists = np.arange(0, ratio * proj_line.length - 1e-6, res_km)
   else:
     n_intervals = ratio * proj_line.length // res_km
-    points = sgeo.MultiPoint(
-        [proj_line.interpolate(dist)
-         for dist in np.linspace(0, ratio * proj_line.length, n_intervals)])
-  points = _InvProjectEqc(points, ref_latitude)
-  return [(round(p.x, precision), round(p.y, precision)) for p in points]
+    dists = np.linspace(0, ratio * proj_line.length, n_intervals)
+  if _HAS_SHAPELY2:
+    # Interpolate all distances in one compiled call and inverse-project the
+    # raw coordinate array with a single vector op, avoiding per-point
+    # geometry allocations.
+    points = shapely.line_interpolate_point(proj_line, dists)
+    coords = shapely.get_coordinates(points)
+    coords /= scales
+    np.round(coords, precision, out=coords)
+    return [(lon, lat) for lon, lat in coords]
+  points = sgeo.MultiPoint([proj_line.interpolate(dist) for dist in dists])
+  points = _InvProjectEqc(points, ref_latitude, scales=scales)
+  return [(round(p.x, precision), round(p.y, precision))
+          for p in _GeomsOf(points)]
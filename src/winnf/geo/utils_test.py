@@ -152,6 +152,18 @@ class TestUtils(unittest.TestCase):
     pts = utils.GridPolygon(ops.unary_union(shape_geo), res_arcsec=1800)
     self.assertSetEqual(set(pts), exp_pts)
 
+  def test_grid_as_array(self):
+    with open(os.path.join(TEST_DIR, 'test_geocollection.json'), 'r') as fd:
+      json_geo = json.load(fd)
+    pts = utils.GridPolygon(json_geo, res_arcsec=1800)
+    arr = utils.GridPolygon(json_geo, res_arcsec=1800, as_array=True)
+    self.assertEqual(list(map(tuple, arr.tolist())), pts)
+
+    poly = sgeo.Polygon([(0, 0), (0.5, 0), (0.5, 0.5), (0, 0.5)])
+    pts = utils.GridPolygonMetric(poly, res_km=10.)
+    arr = utils.GridPolygonMetric(poly, res_km=10., as_array=True)
+    self.assertEqual(list(map(tuple, arr.tolist())), pts)
+
   def test_polygons_equal(self):
     poly_ref = sgeo.Point(0,0).buffer(1)
 
@@ -235,6 +247,16 @@ class TestUtils(unittest.TestCase):
     self.assertIn('coordinates', json_poly)
     self.assertTrue(json_poly['coordinates'] == [[loop1], [list(reversed(loop2))]])
 
+  def test_togeojson_as_dict(self):
+    loop = [[-95.0, 40.0], [-95.5, 40.5], [-95.5, 40.0], [-95.0, 40.0]]
+    hole = [[-95.2, 40.2], [-95.3, 40.3], [-95.3, 40.2], [-95.2, 40.2]]
+    poly = sgeo.Polygon(loop, [hole])
+
+    json_poly = utils.ToGeoJson(poly, as_dict=True)
+    # The dict form matches a dumps/loads round-trip: lists, not tuples.
+    self.assertEqual(json_poly, json.loads(utils.ToGeoJson(poly)))
+    self.assertTrue(json_poly['coordinates'] == [loop, list(reversed(hole))])
+
   def test_toshapely(self):
     poly = sgeo.Point(0, 0).buffer(1)
     poly_json = utils.ToGeoJson(poly)
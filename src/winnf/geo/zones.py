@@ -31,15 +31,33 @@ Typical usage:
   urban_areas = GetUrbanAreas()
 
 """
+import contextlib
+import hashlib
 import os
+import struct
+import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
-from pykml import parser
+try:
+  from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+  shared_memory = None
+
+import numpy as np
+import shapely
 import shapely.geometry as sgeo
 import shapely.ops as ops
+import shapely.wkb
+from shapely.strtree import STRtree
 
 import winnf
 
+try:
+  from winnf.geo._kml_parse import ParseCoordString
+except ImportError:
+  ParseCoordString = None
+
 # The reference files for extra zones.
 USBORDER_FILE = 'usborder.kmz'
 URBAN_AREAS_FILE = 'Urban_Areas_3601.kmz'
@@ -48,7 +66,12 @@ USCANADA_BORDER_FILE = 'uscabdry_sampled.kmz'
 
 # Pointers to the data
 _border_zone = None
+_border_simplify_deg = None
 _uscanada_border = None
+_uscanada_simplify_deg = None
+_urban_areas = None
+_urban_tree = None
+_urban_simplify_deg = None
 
 
 
@@ -58,47 +81,204 @@ def _SplitCoordinates(coord):
   return float(lon), float(lat)
 
 
-def _GetPoint(point):
-  """Gets a Point from a placemark."""
-  coord = point.coordinates.text.strip()
-  return sgeo.Point(_SplitCoordinates(coord))
+def _ParseCoordinates(text):
+  """Returns an (N,2) lon,lat array from a KML 'coordinates' text field.
+
+  The whole field ('lon,lat[,alt]' tuples separated by whitespace) is parsed
+  in a single vectorized pass, instead of a Python split and a pair of
+  float() calls per vertex.
+  """
+  if ParseCoordString is not None and len(text) > 4096:
+    # Compiled strtod scan (optional Cython extension): skips the
+    # whitespace-normalized copy of the text that fromstring requires,
+    # which matters on the large urban area rings.
+    return ParseCoordString(text)
+  num_fields = text.split(None, 1)[0].count(',') + 1
+  values = np.fromstring(text.replace(',', ' '), dtype=np.float64, sep=' ')
+  return values.reshape(-1, num_fields)[:, :2]
+
+
+# Cache of the dynamically built zone classes, keyed by their fields tuple.
+_zone_classes = {}
+
 
+def _ZoneClass(data_fields):
+  """Returns a simplistic struct holder class for zones with `data_fields`.
 
-def _GetPolygon(poly):
-  """Returns a |shapely.geometry.Polygon| from a KML 'Polygon' element."""
-  out_ring = poly.outerBoundaryIs.LinearRing.coordinates.text.strip().split(' ')
-  out_points = [_SplitCoordinates(coord) for coord in out_ring]
-  int_points = []
+  The class uses __slots__ so the zone instances carry no per-instance
+  __dict__: this matters for zone files with thousands of placemarks whose
+  returned dictionaries linger in memory. Classes are built once per fields
+  tuple and cached.
+  """
+  key = tuple(data_fields)
+  cls = _zone_classes.get(key)
+  if cls is None:
+    def Init(self):
+      """Initializes geometry and all data fields to None."""
+      self.geometry = None
+      for field in key:
+        setattr(self, field, None)
+
+    def Repr(self):
+      """Return zone representation."""
+      return 'Zone(geometry=%s, %s)' % (
+          'None' if self.geometry is None else self.geometry.type,
+          ', '.join(['%s=%s' % (attr, getattr(self, attr)) for attr in key]))
+
+    cls = type('Zone', (), {
+        '__slots__': ('geometry',) + key,
+        'fields': key,
+        '__init__': Init,
+        '__repr__': Repr,
+    })
+    _zone_classes[key] = cls
+  return cls
+
+
+def _IterKmlElements(kml_path, root_id, ignore_if_parent=None):
+  """Yields (tag, element) for each KML `root_id` element of a KML/KMZ file.
+
+  The file is streamed with xml.etree iterparse instead of materializing a
+  full lxml object tree; each element is cleared once consumed, so peak
+  memory stays at a single subtree. `tag` is the namespace prefix to use
+  for lookups within the element. Outer elements of nested `root_id`
+  elements are skipped, as are elements whose parent tag ends with
+  `ignore_if_parent`, matching the previous tree-walk behavior.
+  """
+  with contextlib.ExitStack() as stack:
+    if kml_path.endswith('kmz'):
+      kmz = stack.enter_context(zipfile.ZipFile(kml_path))
+      # namelist() avoids building ZipInfo objects and stops at the first
+      # KML member instead of scanning the whole archive directory.
+      kml_name = next(name for name in kmz.namelist()
+                      if name.endswith('.kml'))
+      kml_file = stack.enter_context(kmz.open(kml_name))
+    else:
+      kml_file = stack.enter_context(open(kml_path, 'rb'))
+    parents = []
+    for event, element in ET.iterparse(kml_file, events=('start', 'end')):
+      if event == 'start':
+        parents.append(element)
+        continue
+      parents.pop()
+      tag = element.tag[:element.tag.rfind('}') + 1]
+      if element.tag != tag + root_id:
+        continue
+      # Ignore nested root_id within root_id (the nested ones, already
+      # consumed and cleared, still mark their presence in the tree).
+      if element.find('.//' + tag + root_id) is not None:
+        continue
+      if (ignore_if_parent is not None and parents
+          and parents[-1].tag.endswith(ignore_if_parent)):
+        continue
+      yield tag, element
+      element.clear()
+
+
+# Magic prefix of the geometry cache files (bump to invalidate the format).
+_CACHE_MAGIC = b'WNFC1\n'
+
+
+def _CachePath(kml_path, *params):
+  """Returns the geometry cache file path for a KML source file, or None.
+
+  The cache key covers the source path, its mtime and the read parameters,
+  so editing the KML or changing options invalidates it naturally. The
+  cache lives in a per-user directory rather than the shared tempdir,
+  whose world-writable predictable paths another local user could
+  pre-create.
+  """
+  key = hashlib.sha1(
+      ('%s:%s:%s' % (kml_path, os.path.getmtime(kml_path), params))
+      .encode()).hexdigest()
+  cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'winnf')
   try:
-    for inner_boundary in poly.innerBoundaryIs:
-      inner_ring = inner_boundary.LinearRing.coordinates.text.strip().split(' ')
-      int_points.append([_SplitCoordinates(coord) for coord in inner_ring])
-  except AttributeError:
-    pass
-  return sgeo.Polygon(out_points, holes=int_points)
+    os.makedirs(cache_dir, exist_ok=True)
+  except OSError:
+    return None
+  return os.path.join(cache_dir, 'winnf_%s.wkb' % key)
+
 
+def _ReadGeometryCache(cache_path):
+  """Returns the {name: geometry} dict from a cache file, or None if unusable."""
+  try:
+    with open(cache_path, 'rb') as fd:
+      data = fd.read()
+    if not data.startswith(_CACHE_MAGIC):
+      return None
+    geometries = {}
+    pos = len(_CACHE_MAGIC)
+    while pos < len(data):
+      name_size, wkb_size = struct.unpack_from('<II', data, pos)
+      pos += 8
+      name = data[pos:pos + name_size].decode('utf-8')
+      pos += name_size
+      geometries[name] = shapely.wkb.loads(data[pos:pos + wkb_size])
+      pos += wkb_size
+    return geometries
+  except Exception:
+    # Any unusable cache (missing, truncated, stale format) falls back to
+    # a full parse.
+    return None
+
+
+def _WriteGeometryCache(cache_path, geometries):
+  """Writes a {name: geometry} dict as length-prefixed WKB records.
+
+  Failures are ignored. The format deliberately avoids pickle so reading
+  a cache file can never execute code: each record is a uint32 name byte
+  length, the utf-8 name, a uint32 WKB byte length and the WKB.
+  """
+  if cache_path is None or not all(
+      isinstance(name, str) for name in geometries):
+    return
+  try:
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as fd:
+      fd.write(_CACHE_MAGIC)
+      for name, geometry in geometries.items():
+        name_bytes = name.encode('utf-8')
+        wkb = geometry.wkb
+        fd.write(struct.pack('<II', len(name_bytes), len(wkb)))
+        fd.write(name_bytes)
+        fd.write(wkb)
+    os.replace(tmp_path, cache_path)
+  except OSError:
+    pass
 
-def _GetLineString(linestring):
-  """Returns a |shapely.geometry.LineString| from a KML 'LineString' element."""
-  coords = linestring.coordinates.text.strip().split(' ')
-  points = [_SplitCoordinates(coord) for coord in coords]
-  return sgeo.LineString(points)
 
+def _BuildZoneGeometry(polygon_rings, simplify, fix_invalid, name):
+  """Builds a zone Polygon/MultiPolygon from raw KML ring texts.
 
-# A private struct for configurable zone with geometry and attributes
-class _Zone:
-  """A simplistic struct holder for zones."""
-  def __init__(self, fields):
-    """Initializes attributes to None for a list of `fields`."""
-    self.fields = fields
-    for field in fields:
-      setattr(self, field, None)
+  Args:
+    polygon_rings: A list of (outer_text, inner_texts) per KML 'Polygon',
+      holding the raw 'coordinates' fields of the outer and inner rings.
+    simplify: If set, simplifies the resulting polygons.
+    fix_invalid: If True, try to fix invalid zone (using make_valid).
+    name: The zone name, used in error reporting.
 
-  def __repr__(self):
-    """Return zone representation."""
-    return 'Zone(geometry=%s, %s)' % (
-        'None' if not hasattr(self, 'geometry') else self.geometry.type,
-        ', '.join(['%s=%s' % (attr, getattr(self, attr)) for attr in self.fields]))
+  Raises:
+    ValueError: If the polygon is invalid and cannot be cured.
+  """
+  polygons = [sgeo.Polygon(_ParseCoordinates(out_text),
+                           holes=[_ParseCoordinates(text)
+                                  for text in inner_texts])
+              for out_text, inner_texts in polygon_rings]
+  if len(polygons) == 1:
+    polygon = polygons[0]
+  else:
+    polygon = sgeo.MultiPolygon(polygons)
+  # Fix most invalid polygons. The validity check is far cheaper than the
+  # repair, and most zones are valid to start with.
+  if fix_invalid and not polygon.is_valid:
+    polygon = (shapely.make_valid(polygon)
+               if hasattr(shapely, 'make_valid') else polygon.buffer(0))
+  if simplify:
+    polygon = polygon.simplify(simplify)
+  if not polygon.is_valid:
+    # polygon is broken and should be fixed upstream
+    raise ValueError('Polygon %s is invalid and cannot be cured.' % name)
+  return polygon
 
 
 def ReadKmlZones(kml_path, root_id_zone='Placemark', ignore_if_parent=None,
@@ -113,7 +293,7 @@ def ReadKmlZones(kml_path, root_id_zone='Placemark', ignore_if_parent=None,
     data_fields: List of string defining the data fields to extract from the KML
       'ExtendedData'. If None, nothing is extracted.
     simplify: If set, simplifies the resulting polygons.
-    fix_invalid: If True, try to fix invalid DPA zone (using buffer(0) trick).
+    fix_invalid: If True, try to fix invalid DPA zone (using make_valid).
 
   Returns:
     A dictionary of elements keyed by their name, with each elements being:
@@ -125,70 +305,92 @@ def ReadKmlZones(kml_path, root_id_zone='Placemark', ignore_if_parent=None,
             if the data fields is unset in the KML. If several identical data_fields are
             found, they are put in a list.
   """
-  if kml_path.endswith('kmz'):
-    with zipfile.ZipFile(kml_path) as kmz:
-      kml_name = [info.filename for info in kmz.infolist()
-                  if os.path.splitext(info.filename)[1] == '.kml'][0]
-      with kmz.open(kml_name) as kml_file:
-        root = parser.parse(kml_file).getroot()
-  else:
-    with open(kml_path, 'rb') as kml_file:
-      root = parser.parse(kml_file).getroot()
-  tag = root.tag[:root.tag.rfind('}')+1]
-  zones = {}
-  for element in root.findall('.//' + tag + root_id_zone):
-    # Ignore nested root_id within root_id
-    if element.find('.//' + tag + root_id_zone) is not None:
-      continue
-    if ignore_if_parent is not None and element.getparent().tag.endswith(ignore_if_parent):
-      continue
+  # The KMZ sources are static: geometry-only reads are served from a
+  # WKB cache, skipping the XML parse entirely on later runs.
+  cache_path = None
+  if data_fields is None:
+    cache_path = _CachePath(kml_path, root_id_zone, ignore_if_parent,
+                            simplify, fix_invalid)
+    cached_zones = _ReadGeometryCache(cache_path)
+    if cached_zones is not None:
+      return cached_zones
+
+  # Stream the KML, collecting the raw texts per zone: the XML access
+  # stays single-threaded while the geometry building below is farmed out.
+  elements = []
+  for tag, element in _IterKmlElements(kml_path, root_id_zone,
+                                       ignore_if_parent):
+    name = element.findtext(tag + 'name')
+    polygon_rings = []
+    for poly in element.findall('.//' + tag + 'Polygon'):
+      out_text = poly.find(tag + 'outerBoundaryIs/' + tag + 'LinearRing/'
+                           + tag + 'coordinates').text
+      inner_texts = [
+          inner_boundary.find(tag + 'LinearRing/' + tag + 'coordinates').text
+          for inner_boundary in poly.findall(tag + 'innerBoundaryIs')]
+      polygon_rings.append((out_text, inner_texts))
+    point_texts = []
+    if not polygon_rings:
+      point_texts = [point.find(tag + 'coordinates').text
+                     for point in element.findall('.//' + tag + 'Point')]
+    ext_data = []
+    if data_fields is not None:
+      ext_element = element.find(tag + 'ExtendedData')
+      if ext_element is not None:
+        ext_data = [(data.attrib['name'], data.findtext(tag + 'value'))
+                    for data in ext_element]
+    elements.append((name, polygon_rings, point_texts, ext_data))
+
+  # Per-zone construction (parsing, validity fix and check) is independent
+  # across zones and the GEOS calls release the GIL, so a thread pool gets
+  # near-linear scaling on the big urban-areas KMZ.
+  def BuildGeometry(item):
+    name, polygon_rings, _, _ = item
+    if not polygon_rings:
+      return None
+    return _BuildZoneGeometry(polygon_rings, simplify, fix_invalid, name)
+
+  with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+    geometries = list(executor.map(BuildGeometry, elements))
+
+  if data_fields is not None:
+    zone_cls = _ZoneClass(data_fields)
+    # Map from lowercased KML attribute name to the requested field name,
+    # built once instead of a list scan per extended-data entry.
+    field_by_lower = {field.lower(): field for field in data_fields}
 
-    name = element.name.text
-    # Read the zone geometry
-    geometry = None
-    polygons = [_GetPolygon(poly)
-                for poly in element.findall('.//' + tag + 'Polygon')]
-    if polygons:
-      if len(polygons) == 1:
-        polygon = polygons[0]
-      else:
-        polygon = sgeo.MultiPolygon(polygons)
-      # Fix most invalid polygons
-      if fix_invalid:
-        polygon = polygon.buffer(0)
-      if simplify:
-        polygon.simplify(simplify)
-      if not polygon.is_valid:
-        # polygon is broken and should be fixed upstream
-        raise ValueError('Polygon %s is invalid and cannot be cured.' % name)
-      geometry = polygon
-    else:
-      points = [_GetPoint(point)
-                for point in element.findall('.//' + tag + 'Point')]
-      geometry = ops.unary_union(points)
+  zones = {}
+  for (name, _, point_texts, ext_data), geometry in zip(elements, geometries):
+    if geometry is None:
+      geometry = ops.unary_union([sgeo.Point(_SplitCoordinates(text))
+                                  for text in point_texts])
 
     # Read the data_fields
     if data_fields is None:
       zones[name] = geometry
     else:
-      zone = _Zone(data_fields)
+      zone = zone_cls()
       zone.geometry = geometry
-      data_fields_lower = [field.lower() for field in data_fields]
       zones[name] = zone
-      ext_data = element.ExtendedData.getchildren()
-      for data in ext_data:
-        data_attrib = data.attrib['name']
-        data_value = str(data.value)
-        if data_attrib.lower() in data_fields_lower:
-          if getattr(zone, data_attrib, None) is None:
-            setattr(zone, data_attrib, data_value)
-          else:
-            existing_data = getattr(zone, data_attrib)
-            try:
-              existing_data.append(str(data_value))
-              setattr(zone, data_attrib, existing_data)
-            except:
-              setattr(zone, data_attrib, [existing_data, str(data_value)])
+      # Accumulate the values in a local dict, flushed once per zone: no
+      # repeated getattr/setattr per extended-data entry.
+      values = {}
+      for data_attrib, data_value in ext_data:
+        field = field_by_lower.get(data_attrib.lower())
+        if field is None:
+          continue
+        data_value = str(data_value)
+        existing_data = values.get(field)
+        if existing_data is None:
+          values[field] = data_value
+        elif isinstance(existing_data, list):
+          existing_data.append(data_value)
+        else:
+          values[field] = [existing_data, data_value]
+      for field, value in values.items():
+        setattr(zone, field, value)
+  if cache_path is not None:
+    _WriteGeometryCache(cache_path, zones)
   return zones
 
 
@@ -202,25 +404,17 @@ def ReadKmlBorder(kml_path, root_id='Placemark'):
   Returns:
     A dictionary of |shapely| LineString keyed by their names.
   """
-  if kml_path.endswith('kmz'):
-    with zipfile.ZipFile(kml_path) as kmz:
-      kml_name = [info.filename for info in kmz.infolist()
-                  if os.path.splitext(info.filename)[1] == '.kml'][0]
-      with kmz.open(kml_name) as kml_file:
-        root = parser.parse(kml_file).getroot()
-  else:
-    with open(kml_path, 'rb') as kml_file:
-      root = parser.parse(kml_file).getroot()
+  cache_path = _CachePath(kml_path, root_id)
+  cached_borders = _ReadGeometryCache(cache_path)
+  if cached_borders is not None:
+    return cached_borders
 
-  tag = root.tag[:root.tag.rfind('}') + 1]
   linetrings_dict = {}
-  for element in root.findall('.//' + tag + root_id):
-    # Ignore nested root_id within root_id
-    if element.find('.//' + tag + root_id) is not None:
-      continue
-    name = element.name.text
+  for tag, element in _IterKmlElements(kml_path, root_id):
+    name = element.findtext(tag + 'name')
     linestrings = [
-        _GetLineString(l)
+        sgeo.LineString(_ParseCoordinates(
+            l.find(tag + 'coordinates').text))
         for l in element.findall('.//' + tag + 'LineString')
     ]
     if not linestrings:
@@ -232,42 +426,147 @@ def ReadKmlBorder(kml_path, root_id='Placemark'):
 
     linetrings_dict[name] = linestring
 
+  _WriteGeometryCache(cache_path, linetrings_dict)
   return linetrings_dict
 
 
-def GetUsCanadaBorder():
-  """Gets the US/Canada border as a |shapely.MultiLineString|."""
-  global _uscanada_border
-  if _uscanada_border is None:
-    kml_file = os.path.join(winnf.GetZonesDir(), USCANADA_BORDER_FILE)
-    lines = ReadKmlBorder(kml_file)
-    _uscanada_border = ops.unary_union(list(lines.values()))
+def _ReadSharedGeometry(shared_name):
+  """Returns the geometry published under `shared_name`, or None if absent.
+
+  The segment layout is a little-endian uint64 WKB byte length followed by
+  the WKB itself (the segment size may be rounded up to a page).
+  """
+  if shared_memory is None:
+    return None
+  try:
+    shm = shared_memory.SharedMemory(name=shared_name)
+  except (FileNotFoundError, OSError):
+    return None
+  try:
+    (num_bytes,) = struct.unpack('<Q', bytes(shm.buf[:8]))
+    return shapely.wkb.loads(bytes(shm.buf[8:8 + num_bytes]))
+  finally:
+    shm.close()
+
+
+def _PublishSharedGeometry(shared_name, geometry):
+  """Publishes a geometry WKB under `shared_name`; failures are ignored.
+
+  The segment stays alive until the creating process exits, so sibling
+  worker processes deserialize the shared bytes instead of re-parsing the
+  source KMZ.
+  """
+  if shared_memory is None:
+    return
+  try:
+    wkb = geometry.wkb
+    shm = shared_memory.SharedMemory(name=shared_name, create=True,
+                                     size=8 + len(wkb))
+    shm.buf[:8] = struct.pack('<Q', len(wkb))
+    shm.buf[8:8 + len(wkb)] = wkb
+    shm.close()
+  except (OSError, ValueError):
+    pass
+
+
+def GetUsCanadaBorder(simplify_deg=1e-6, shared_name=None):
+  """Gets the US/Canada border as a |shapely.MultiLineString|.
+
+  Args:
+    simplify_deg: if defined, simplify each border line with given tolerance
+      (degrees) before the union. The GEOS union cost grows super-linearly
+      with the total vertex count, so even the default 1e-6 (about 10cm)
+      speeds it up at no measurable accuracy cost.
+    shared_name: if defined, the border WKB is published in (or read back
+      from) a shared memory segment of that name, so multiprocessing
+      workers share one parse instead of each paying it. The caller is
+      responsible for using consistent `simplify_deg` across processes.
+  """
+  global _uscanada_border, _uscanada_simplify_deg
+  if _uscanada_border is None or simplify_deg != _uscanada_simplify_deg:
+    # Drop any border cached with a different tolerance before attempting
+    # the shared read, so a tolerance change always triggers a rebuild.
+    _uscanada_border = None
+    if shared_name:
+      _uscanada_border = _ReadSharedGeometry(shared_name)
+    if _uscanada_border is None:
+      kml_file = os.path.join(winnf.GetZonesDir(), USCANADA_BORDER_FILE)
+      lines = list(ReadKmlBorder(kml_file).values())
+      if simplify_deg:
+        lines = [line.simplify(simplify_deg) for line in lines]
+      _uscanada_border = ops.unary_union(lines)
+      if shared_name:
+        _PublishSharedGeometry(shared_name, _uscanada_border)
+    _uscanada_simplify_deg = simplify_deg
   return _uscanada_border
 
 
-def GetUsBorder():
+def GetUsBorder(simplify_deg=1e-6, shared_name=None):
   """Gets the US border as a |shapely.MultiPolygon|.
 
   This is a composite US border for simulation purposes only.
+
+  Args:
+    simplify_deg: if defined, simplify each border zone with given tolerance
+      (degrees) before the union. The GEOS union cost grows super-linearly
+      with the total vertex count, so even the default 1e-6 (about 10cm)
+      speeds it up at no measurable accuracy cost.
+    shared_name: if defined, the border WKB is published in (or read back
+      from) a shared memory segment of that name, so multiprocessing
+      workers share one parse instead of each paying it. The caller is
+      responsible for using consistent `simplify_deg` across processes.
   """
-  global _border_zone
-  if _border_zone is None:
-    kml_file = os.path.join(winnf.GetZonesDir(), USBORDER_FILE)
-    zones = ReadKmlZones(kml_file)
-    _border_zone = ops.unary_union(list(zones.values()))
+  global _border_zone, _border_simplify_deg
+  if _border_zone is None or simplify_deg != _border_simplify_deg:
+    # Drop any border cached with a different tolerance before attempting
+    # the shared read, so a tolerance change always triggers a rebuild.
+    _border_zone = None
+    if shared_name:
+      _border_zone = _ReadSharedGeometry(shared_name)
+    if _border_zone is None:
+      kml_file = os.path.join(winnf.GetZonesDir(), USBORDER_FILE)
+      zones = ReadKmlZones(kml_file, simplify=simplify_deg)
+      _border_zone = ops.unary_union(list(zones.values()))
+      if shared_name:
+        _PublishSharedGeometry(shared_name, _border_zone)
+    _border_simplify_deg = simplify_deg
   return _border_zone
 
 
-def GetUrbanAreas(simplify_deg=1e-3):
+def GetUrbanAreas(simplify_deg=1e-3, force_reload=False):
   """Gets the US urban area as a |shapely.GeometryCollection|.
 
-  Note: Client code should cache it as expensive to load (and not cached here).
+  The result is cached at module level, so only the first call (or a call
+  changing `simplify_deg` or passing `force_reload`) pays the KMZ parse.
+
+  Args:
+    simplify_deg: if defined, simplify the zone with given tolerance (degrees).
+      Default is 1e-3 which corresponds roughly to 100m in continental US.
+    force_reload: If True, reloads from the KMZ even when cached.
+  """
+  global _urban_areas, _urban_tree, _urban_simplify_deg
+  if (force_reload or _urban_areas is None
+      or simplify_deg != _urban_simplify_deg):
+    kml_file = os.path.join(winnf.GetZonesDir(), URBAN_AREAS_FILE)
+    zones = ReadKmlZones(kml_file, root_id_zone='Document',
+                         simplify=simplify_deg)
+    geometries = list(zones.values())
+    _urban_areas = sgeo.GeometryCollection(geometries)  # ops.unary_union(geometries)
+    _urban_tree = STRtree(geometries)
+    _urban_simplify_deg = simplify_deg
+  return _urban_areas
+
+
+def GetUrbanAreasTree(simplify_deg=1e-3):
+  """Gets a |shapely.STRtree| over the US urban area polygons.
+
+  Point-in-urban-area queries through the tree (for example
+  `tree.query(geom, predicate='intersects')`) are O(log N) instead of a
+  linear scan of the collection returned by `GetUrbanAreas`.
 
   Args:
     simplify_deg: if defined, simplify the zone with given tolerance (degrees).
       Default is 1e-3 which corresponds roughly to 100m in continental US.
   """
-  kml_file = os.path.join(winnf.GetZonesDir(), URBAN_AREAS_FILE)
-  zones = ReadKmlZones(kml_file, root_id_zone='Document', simplify=simplify_deg)
-  urban_areas = sgeo.GeometryCollection(list(zones.values()))  # ops.unary_union(list(zones.values()))
-  return urban_areas
+  GetUrbanAreas(simplify_deg)
+  return _urban_tree
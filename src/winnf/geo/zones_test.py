@@ -36,6 +36,17 @@ class TestZones(unittest.TestCase):
     self.assertTrue(approx_area > exp_area * 0.9 and
                     approx_area < exp_area * 1.1)
 
+  def test_urban_areas_tree(self):
+    tree = zones.GetUrbanAreasTree()
+    # Downtown San Francisco is urban, the middle of Nevada is not.
+    urban_point = sgeo.Point(-122.42, 37.78)
+    idxs = tree.query(urban_point, predicate='intersects')
+    self.assertEqual(len(idxs), 1)
+    self.assertTrue(tree.geometries[idxs[0]].contains(urban_point))
+    rural_point = sgeo.Point(-117.0, 39.5)
+    self.assertEqual(
+        len(tree.query(rural_point, predicate='intersects')), 0)
+
   def test_read_usborder(self):
     z = zones.GetUsBorder()
     self.assertTrue(z.is_valid)
@@ -50,15 +61,13 @@ class TestZones(unittest.TestCase):
     # Official length of main and alaska are resp 3987 miles and 1538 miles
     exp_borders_length = sum(np.array([3987, 1538]) * 1.60934)
     approx_len = 0
-    for j, border in enumerate(borders):
-      points = list(zip(*border.xy))
-      for k in range(len(points)-1):
-        if points[k][0] > -67.8 and points[k][1] < 44.77:
-          continue  # the border file includes a maritime part not accounted in border length
-        dlat = points[k+1][1] - points[k][1]
-        dlon = points[k+1][0] - points[k][0]
-        d = np.sqrt((dlat * 111)**2 + (dlon * 111 * np.cos(points[k][1]*np.pi/180.))**2)
-        approx_len += d
+    for border in borders.geoms:
+      lon, lat = np.asarray(border.coords).T
+      # The border file includes a maritime part not accounted in border length.
+      keep = ~((lon[:-1] > -67.8) & (lat[:-1] < 44.77))
+      d = np.sqrt((np.diff(lat) * 111)**2 +
+                  (np.diff(lon) * 111 * np.cos(lat[:-1]*np.pi/180.))**2)
+      approx_len += d[keep].sum()
     self.assertTrue(abs(approx_len - exp_borders_length) < 40)
 
 
@@ -79,16 +79,30 @@ class UsgsPopDriver(object):
       raise ValueError('No TIFF file name in directory: %s' % pop_directory)
     self._tiff_path = tiff_path[0]
     self._raster_info = _RasterInfo(self._tiff_path)
-    self._raster = np.zeros((self._raster_info.height, self._raster_info.width),
-                            dtype=np.uint16)
-    dataset = gdal.Open(self._tiff_path)
-    raster_band = dataset.GetRasterBand(1)
+    # The dataset handle is kept open for the lifetime of the driver: lazy
+    # drivers issue many small block reads and reopening the TIFF per read
+    # would dominate.
+    self._dataset = gdal.Open(self._tiff_path)
+    raster_band = self._dataset.GetRasterBand(1)
     self._block_xsize, self._block_ysize = raster_band.GetBlockSize()
-    dataset = None
-    self._raster_mask = np.zeros(
-        (self._raster_info.height // self._block_ysize + 1,
-         self._raster_info.width // self._block_xsize + 1),
-        dtype=np.bool)
+    self._raster = None
+    self._raster_mask = None
+
+  def _EnsureRaster(self):
+    """Allocates the raster array and block mask on first use.
+
+    np.zeros is a calloc: the OS maps the pages on first write, so the
+    resident memory of a partially loaded raster stays proportional to the
+    blocks actually read, not to the full map size.
+    """
+    if self._raster is None:
+      self._raster = np.zeros(
+          (self._raster_info.height, self._raster_info.width),
+          dtype=np.uint16)
+      self._raster_mask = np.zeros(
+          (self._raster_info.height // self._block_ysize + 1,
+           self._raster_info.width // self._block_xsize + 1),
+          dtype=bool)
 
   def LoadRaster(self, box=None):
     """Load raster in memory.
@@ -97,7 +111,8 @@ class UsgsPopDriver(object):
       box: A (lat_min, lon_min, lat_max, lon_max) bounding box. If None, the
         full raster is loaded in memory.
     """
-    dataset = gdal.Open(self._tiff_path)
+    self._EnsureRaster()
+    dataset = self._dataset
     raster_band = dataset.GetRasterBand(1)
     row_min, row_max = 0, dataset.RasterYSize-1
     col_min, col_max = 0, dataset.RasterXSize-1
@@ -128,9 +143,7 @@ class UsgsPopDriver(object):
         self._raster_mask[b_y, b_x] = True
 
     if box is None:
-      self.all_loaded = True
-    # Close the file
-    dataset = None
+      self.fully_loaded = True
 
   def GetPopulationDensity(self, latitudes, longitudes):
     """Retrieves the population density on locations.
@@ -146,17 +159,17 @@ class UsgsPopDriver(object):
       return 0
     latitudes = np.asarray(latitudes)
     longitudes = np.asarray(longitudes)
+    if self.lazy_load and not self.fully_loaded:
+      lat_min, lat_max = np.min(latitudes), np.max(latitudes)
+      lon_min, lon_max = np.min(longitudes), np.max(longitudes)
+      self.LoadRaster((lat_min, lon_min, lat_max, lon_max))
+    self._EnsureRaster()
     densities = np.zeros(len(latitudes), dtype=np.int16)
     rows, cols = self._raster_info.Indexes(latitudes, longitudes)
     idx_inside = np.where((rows >= 0) &
                           (cols >= 0) &
                           (rows < self._raster.shape[0]) &
                           (cols < self._raster.shape[1]))[0]
-    if self.lazy_load and not self.fully_loaded:
-      lat_min, lat_max = np.min(latitudes), np.max(latitudes)
-      lon_min, lon_max = np.min(longitudes), np.max(longitudes)
-      self.LoadRaster((lat_min, lon_min, lat_max, lon_max))
-
     densities[idx_inside] = self._raster[rows[idx_inside], cols[idx_inside]]
     return densities
 
@@ -239,10 +252,11 @@ class _RasterInfo:
       A tuple (idx_row, idx_col) of ndarrays specifying the index in the
         raster matrix.
     """
-    res = self._transform.TransformPoints(
-        np.column_stack((longitudes, latitudes)))
-    res = list(zip(*res))
-    x, y = np.array(res[0]), np.array(res[1])
+    # TransformPoints is a single batched GDAL call; a single asarray of
+    # its output replaces the per-point zip/tuple shuffling.
+    res = np.asarray(self._transform.TransformPoints(
+        np.column_stack((longitudes, latitudes))))
+    x, y = res[:, 0], res[:, 1]
     idx_col = self._inv_txf[0] + self._inv_txf[1] * x + self._inv_txf[2] * y
     idx_row = self._inv_txf[3] + self._inv_txf[4] * x + self._inv_txf[5] * y
     return idx_row.astype(int), idx_col.astype(int)